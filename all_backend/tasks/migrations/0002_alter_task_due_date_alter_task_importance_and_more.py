@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-08-27 01:20
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='due_date',
+            field=models.DateField(db_index=True, help_text='Task deadline'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='importance',
+            field=models.IntegerField(db_index=True, help_text='User-defined importance rating (1-10)', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(10)]),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['importance', '-due_date'], name='task_imp_due_idx'),
+        ),
+    ]
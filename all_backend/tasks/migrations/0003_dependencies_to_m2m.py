@@ -0,0 +1,66 @@
+from django.db import migrations, models
+
+
+def copy_dependencies_forward(apps, schema_editor):
+    """Populate the M2M through table from the old JSON arrays."""
+    Task = apps.get_model('tasks', 'Task')
+    through = Task.dependencies.through
+
+    existing_ids = set(Task.objects.values_list('id', flat=True))
+    rows = [
+        through(from_task_id=task_id, to_task_id=dep_id)
+        for task_id, deps in Task.objects.values_list('id', 'dependencies_old')
+        for dep_id in (deps or [])
+        # Dangling IDs were never validated before; drop them rather
+        # than violate the new FK constraint
+        if dep_id in existing_ids
+    ]
+    through.objects.bulk_create(rows, batch_size=500)
+
+
+def copy_dependencies_backward(apps, schema_editor):
+    """Rebuild the JSON arrays from the through table."""
+    Task = apps.get_model('tasks', 'Task')
+    through = Task.dependencies.through
+
+    dep_lists = {}
+    for from_id, to_id in through.objects.values_list('from_task_id', 'to_task_id'):
+        dep_lists.setdefault(from_id, []).append(to_id)
+
+    tasks = list(Task.objects.all())
+    for task in tasks:
+        task.dependencies_old = dep_lists.get(task.id, [])
+    Task.objects.bulk_update(tasks, ['dependencies_old'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_alter_task_due_date_alter_task_importance_and_more'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='task',
+            old_name='dependencies',
+            new_name='dependencies_old',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='dependencies',
+            field=models.ManyToManyField(
+                blank=True,
+                help_text='Tasks that this task depends on',
+                related_name='dependents',
+                to='tasks.task',
+            ),
+        ),
+        migrations.RunPython(
+            copy_dependencies_forward,
+            copy_dependencies_backward,
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='dependencies_old',
+        ),
+    ]
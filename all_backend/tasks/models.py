@@ -1,6 +1,8 @@
 """
 Task model definition for the Smart Task Analyzer.
 """
+from collections import defaultdict
+
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
@@ -13,6 +15,7 @@ class Task(models.Model):
     title = models.CharField(max_length=255, help_text="Task title/description")
     
     due_date = models.DateField(
+        db_index=True,
         help_text="Task deadline"
     )
     
@@ -22,15 +25,19 @@ class Task(models.Model):
     )
     
     importance = models.IntegerField(
+        db_index=True,
         validators=[MinValueValidator(1), MaxValueValidator(10)],
         help_text="User-defined importance rating (1-10)"
     )
     
-    # Store dependencies as JSON array of task IDs
-    dependencies = models.JSONField(
-        default=list,
+    # Real relation (not a JSON array) so dependency traversal is an
+    # indexed JOIN and the database enforces referential integrity
+    dependencies = models.ManyToManyField(
+        'self',
+        symmetrical=False,
+        related_name='dependents',
         blank=True,
-        help_text="List of task IDs that this task depends on"
+        help_text="Tasks that this task depends on"
     )
     
     created_at = models.DateTimeField(auto_now_add=True)
@@ -38,6 +45,9 @@ class Task(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['importance', '-due_date'], name='task_imp_due_idx'),
+        ]
         
     def __str__(self):
         return f"{self.title} (Due: {self.due_date})"
@@ -49,4 +59,32 @@ class Task(models.Model):
     def days_until_due(self):
         """Calculate days remaining until due date (negative if overdue)."""
         delta = self.due_date - timezone.now().date()
-        return delta.days
\ No newline at end of file
+        return delta.days
+
+    @classmethod
+    def fetch_for_scoring(cls):
+        """
+        Materialize every task as a scoring-ready dict.
+
+        Two fixed queries — the scalar columns plus the dependency
+        through table — merged in Python, since values() can't project
+        an M2M without multiplying rows. Day offsets are annotated here
+        so the scoring engine's vectorized path skips date arithmetic.
+        """
+        dep_lists = defaultdict(list)
+        through_rows = cls.dependencies.through.objects.values_list(
+            'from_task_id', 'to_task_id'
+        )
+        for from_id, to_id in through_rows:
+            dep_lists[from_id].append(to_id)
+
+        today = timezone.now().date()
+        return [
+            row | {
+                'dependencies': dep_lists.get(row['id'], []),
+                '_days_diff': (row['due_date'] - today).days,
+            }
+            for row in cls.objects.values(
+                'id', 'title', 'due_date', 'estimated_hours', 'importance'
+            ).iterator(chunk_size=2000)
+        ]
\ No newline at end of file
@@ -5,9 +5,180 @@ This module implements the core priority scoring logic that evaluates tasks
 based on multiple factors: urgency, importance, effort, and dependencies.
 """
 
+from bisect import bisect_left
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass
 from datetime import date
-from typing import List, Dict, Set, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterator, List, Dict, Mapping, Set, Optional
+import heapq
 import math
+import types
+
+import numpy as np
+
+# Numba is optional: when available, the batch scoring kernel is JIT
+# compiled; otherwise the pure-NumPy path below is used.
+try:
+    import numba
+    _HAVE_NUMBA = True
+except ImportError:
+    numba = None
+    _HAVE_NUMBA = False
+
+# Piecewise-linear bucket tables: within bucket i (upper bound
+# _URG_THRESH[i], found via bisect_left/searchsorted), the score is
+# intercept[i] + slope[i] * days_diff. The overdue head and the
+# logarithmic tail fall outside the tables and are special-cased.
+_URG_THRESH = (0, 3, 7, 14, 30)
+_URG_INTERCEPT = (10.0, 9.0, 8.75, 7.9, 5.9)
+_URG_SLOPE = (0.0, 0.0, -0.25, -0.2, -0.1)
+
+# Same layout for effort; the sub-hour head and logarithmic tail are
+# special-cased.
+_EFF_THRESH = (2.0, 4.0, 8.0)
+_EFF_INTERCEPT = (9.0, 9.0, 7.0)
+_EFF_SLOPE = (0.0, -0.5, -0.25)
+
+# Dependency score by number of blocked tasks, capped at 3+
+_DEP_SCORES = (3.0, 6.0, 8.0, 10.0)
+_DEP_SCORES_NP = np.array(_DEP_SCORES)
+
+# Small LRU of full analysis results, keyed on (strategy, day, task
+# fingerprint). Scoring is deterministic given those inputs, so
+# repeated requests over an unchanged task set (polling dashboards)
+# skip the DFS and scoring entirely. The day component invalidates
+# entries when date.today() rolls over.
+_ANALYSIS_CACHE = OrderedDict()
+_ANALYSIS_CACHE_MAXSIZE = 64
+
+
+@dataclass(slots=True)
+class ScoreBreakdown:
+    """
+    Per-task score components produced by the scoring engine.
+
+    A slotted dataclass instead of a dict: roughly a third of the memory
+    per task and faster attribute reads in the explanation and
+    recommendation builders. Rounding is deferred to serialization.
+    """
+    total_score: float
+    urgency_score: float
+    importance_score: float
+    effort_score: float
+    dependency_score: float
+    weights_used: Mapping[str, float]
+
+# NumPy views for the batched path (padded with a dummy tail bucket so
+# searchsorted indices stay in range before the tail is masked in).
+_URG_THRESH_NP = np.array(_URG_THRESH)
+_URG_INTERCEPT_NP = np.array(_URG_INTERCEPT + (0.0,))
+_URG_SLOPE_NP = np.array(_URG_SLOPE + (0.0,))
+
+_EFF_THRESH_NP = np.array(_EFF_THRESH)
+_EFF_INTERCEPT_NP = np.array(_EFF_INTERCEPT + (0.0,))
+_EFF_SLOPE_NP = np.array(_EFF_SLOPE + (0.0,))
+
+
+if _HAVE_NUMBA:
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _score_kernel(days, hours, importance, blocked, weights):  # pragma: no cover
+        """
+        JIT-compiled scoring kernel: returns an (N, 5) matrix with columns
+        total, urgency, importance, effort, dependency. Mirrors the
+        piecewise buckets of the scalar scoring functions.
+        """
+        n = days.shape[0]
+        out = np.empty((n, 5), dtype=np.float64)
+
+        for i in numba.prange(n):
+            d = days[i]
+            if d < 0:
+                urg = 10.0 + min(-d * 0.5, 5.0)
+                if urg > 15.0:
+                    urg = 15.0
+            elif d == 0:
+                urg = 10.0
+            elif d <= 3:
+                urg = 9.0
+            elif d <= 7:
+                urg = 8.0 - (d - 3) * 0.25
+            elif d <= 14:
+                urg = 6.5 - (d - 7) * 0.2
+            elif d <= 30:
+                urg = 4.5 - (d - 14) * 0.1
+            else:
+                urg = max(1.0, 3.0 - math.log10(d - 29.0))
+
+            h = hours[i]
+            if h <= 0:
+                eff = 5.0
+            elif h < 1:
+                eff = 10.0
+            elif h <= 2:
+                eff = 9.0
+            elif h <= 4:
+                eff = 8.0 - (h - 2) * 0.5
+            elif h <= 8:
+                eff = 6.0 - (h - 4) * 0.25
+            else:
+                eff = max(1.0, 5.0 - math.log10(h - 7.0))
+
+            imp = importance[i]
+
+            b = blocked[i]
+            if b == 0:
+                dep = 3.0
+            elif b == 1:
+                dep = 6.0
+            elif b == 2:
+                dep = 8.0
+            else:
+                dep = 10.0
+
+            out[i, 0] = (urg * weights[0] + imp * weights[1] +
+                         eff * weights[2] + dep * weights[3])
+            out[i, 1] = urg
+            out[i, 2] = imp
+            out[i, 3] = eff
+            out[i, 4] = dep
+
+        return out
+else:
+    _score_kernel = None
+
+
+@lru_cache(maxsize=1024)
+def _urgency_from_offset(days_diff: int) -> float:
+    """Map a day offset (due_date - today) to an urgency score, memoized."""
+    if days_diff < 0:  # Overdue
+        # Exponential increase for overdue tasks, capped at 15.0
+        return min(10.0 + min(-days_diff * 0.5, 5.0), 15.0)
+
+    i = bisect_left(_URG_THRESH, days_diff)
+    if i == len(_URG_THRESH):
+        # Asymptotic decay for distant tasks
+        return max(1.0, 3.0 - math.log10(days_diff - 29))
+
+    return _URG_INTERCEPT[i] + _URG_SLOPE[i] * days_diff
+
+
+@lru_cache(maxsize=512)
+def _effort_from_hours(hours: float) -> float:
+    """Map an hours estimate to an effort score, memoized."""
+    if hours <= 0:
+        return 5.0  # Default for invalid data
+
+    if hours < 1:
+        return 10.0  # Quick wins
+
+    i = bisect_left(_EFF_THRESH, hours)
+    if i == len(_EFF_THRESH):
+        # Logarithmic decay for very long tasks
+        return max(1.0, 5.0 - math.log10(hours - 7))
+
+    return _EFF_INTERCEPT[i] + _EFF_SLOPE[i] * hours
 
 
 class TaskScoringEngine:
@@ -54,8 +225,30 @@ class TaskScoringEngine:
         """
         self.weights = self.STRATEGY_WEIGHTS.get(strategy, self.DEFAULT_WEIGHTS)
         self.strategy = strategy
+        # Read-only view shared by every score breakdown instead of a
+        # fresh copy per task
+        self._weights_view = types.MappingProxyType(self.weights)
+        # Pre-flattened weights: tuple for the scalar path, vector for
+        # the batched dot product — avoids four dict lookups per task
+        self._w_tuple = (
+            self.weights['urgency'], self.weights['importance'],
+            self.weights['effort'], self.weights['dependencies']
+        )
+        self._w_vec = np.array(self._w_tuple, dtype=np.float64)
+        # Partial evaluation: generate a scoring function with the
+        # weights baked in as literals, so the scalar hot path does four
+        # constant multiplies with no dict or attribute lookups
+        namespace = {}
+        exec(
+            "def _score(urgency, importance, effort, dependency):\n"
+            "    return (urgency * {0!r} + importance * {1!r}\n"
+            "            + effort * {2!r} + dependency * {3!r})".format(*self._w_tuple),
+            namespace
+        )
+        self._score_fn = namespace['_score']
     
-    def calculate_urgency_score(self, due_date: date) -> float:
+    def calculate_urgency_score(self, due_date: date,
+                                today: Optional[date] = None) -> float:
         """
         Calculate urgency score based on time until due date.
         
@@ -69,27 +262,11 @@ class TaskScoringEngine:
         Returns:
             Float score between 0 and 10
         """
-        today = date.today()
+        if today is None:
+            today = date.today()
         days_diff = (due_date - today).days
-        
-        if days_diff < 0:  # Overdue
-            # Exponential increase for overdue tasks
-            overdue_days = abs(days_diff)
-            score = 10.0 + min(overdue_days * 0.5, 5.0)  # Cap at 15.0
-            return min(score, 15.0)
-        elif days_diff == 0:  # Due today
-            return 10.0
-        elif days_diff <= 3:
-            return 9.0
-        elif days_diff <= 7:
-            return 8.0 - (days_diff - 3) * 0.25
-        elif days_diff <= 14:
-            return 6.5 - (days_diff - 7) * 0.2
-        elif days_diff <= 30:
-            return 4.5 - (days_diff - 14) * 0.1
-        else:
-            # Asymptotic decay for distant tasks
-            return max(1.0, 3.0 - math.log10(days_diff - 29))
+
+        return _urgency_from_offset(days_diff)
     
     def calculate_importance_score(self, importance: int) -> float:
         """
@@ -117,89 +294,112 @@ class TaskScoringEngine:
         Returns:
             Score between 1 and 10
         """
-        if estimated_hours <= 0:
-            return 5.0  # Default for invalid data
-        
-        if estimated_hours < 1:
-            return 10.0
-        elif estimated_hours <= 2:
-            return 9.0
-        elif estimated_hours <= 4:
-            return 8.0 - (estimated_hours - 2) * 0.5
-        elif estimated_hours <= 8:
-            return 6.0 - (estimated_hours - 4) * 0.25
-        else:
-            # Logarithmic decay for very long tasks
-            return max(1.0, 5.0 - math.log10(estimated_hours - 7))
+        # Memoized on the raw value: real-world estimates cluster on a
+        # handful of round numbers, so the cache hits without any
+        # quantizing (which could nudge values across bucket borders)
+        return _effort_from_hours(estimated_hours)
     
-    def calculate_dependency_score(self, task_id: int, all_tasks: List[Dict], 
+    def calculate_dependency_score(self, task_id: int,
                                    dependency_map: Dict[int, List[int]]) -> float:
         """
         Calculate dependency score based on how many tasks depend on this one.
-        
+
         Tasks that block other tasks should have higher priority.
-        
+
         Args:
             task_id: Current task ID
-            all_tasks: List of all task dictionaries
             dependency_map: Map of task_id -> list of dependent task IDs
-            
+
         Returns:
             Score between 0 and 10
         """
-        # Count how many tasks are blocked by this task
-        blocked_count = len(dependency_map.get(task_id, []))
-        
-        if blocked_count == 0:
-            return 3.0  # Base score for tasks with no dependents
-        elif blocked_count == 1:
-            return 6.0
-        elif blocked_count == 2:
-            return 8.0
-        elif blocked_count >= 3:
-            return 10.0
-        
-        return 5.0
+        # Count how many tasks are blocked by this task; () default
+        # avoids allocating a throwaway list per call
+        blocked_count = len(dependency_map.get(task_id, ()))
+
+        return _DEP_SCORES[min(blocked_count, 3)]
     
-    def detect_circular_dependencies(self, tasks: List[Dict]) -> Set[int]:
+    def detect_circular_dependencies(self, tasks: List[Dict],
+                                     task_map: Optional[Dict[int, Dict]] = None) -> Set[int]:
         """
-        Detect circular dependencies using depth-first search.
-        
+        Detect circular dependencies with an iterative Tarjan SCC pass.
+
+        Every task lands in exactly one strongly connected component,
+        and a task sits on a cycle precisely when its component has more
+        than one member or it depends on itself. Each node and edge is
+        processed once — O(V+E) with no recursion depth limit.
+
         Args:
             tasks: List of task dictionaries
-            
+            task_map: Optional prebuilt id -> task mapping to reuse
+
         Returns:
             Set of task IDs involved in circular dependencies
         """
-        task_map = {task['id']: task for task in tasks}
-        visited = set()
-        rec_stack = set()
+        if task_map is None:
+            task_map = {task['id']: task for task in tasks}
+
+        index = {}          # discovery order per node
+        lowlink = {}        # smallest index reachable from the node
+        on_stack = set()
+        scc_stack = []
         circular_tasks = set()
-        
-        def has_cycle(task_id: int) -> bool:
-            visited.add(task_id)
-            rec_stack.add(task_id)
-            
-            task = task_map.get(task_id)
-            if task and 'dependencies' in task:
-                for dep_id in task['dependencies']:
-                    if dep_id not in visited:
-                        if has_cycle(dep_id):
-                            circular_tasks.add(task_id)
-                            return True
-                    elif dep_id in rec_stack:
-                        circular_tasks.add(task_id)
-                        circular_tasks.add(dep_id)
-                        return True
-            
-            rec_stack.remove(task_id)
-            return False
-        
+        counter = 0
+
         for task in tasks:
-            task_id = task['id']
-            if task_id not in visited:
-                has_cycle(task_id)
-        
+            root_id = task['id']
+            if root_id in index:
+                continue
+
+            index[root_id] = lowlink[root_id] = counter
+            counter += 1
+            scc_stack.append(root_id)
+            on_stack.add(root_id)
+            # Explicit stack of (node, iterator over its dependencies)
+            work = [(root_id, iter(task_map[root_id].get('dependencies', [])))]
+
+            while work:
+                node_id, children = work[-1]
+                dep_id = next(children, None)
+
+                if dep_id is None:
+                    # Node finished: fold its lowlink into the parent,
+                    # and pop a component if it is a component root
+                    work.pop()
+                    if work:
+                        parent_id = work[-1][0]
+                        lowlink[parent_id] = min(lowlink[parent_id],
+                                                 lowlink[node_id])
+                    if lowlink[node_id] == index[node_id]:
+                        component = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node_id:
+                                break
+                        if len(component) > 1:
+                            circular_tasks.update(component)
+                    continue
+
+                if dep_id == node_id:
+                    # Self-loop: a cycle regardless of component size
+                    circular_tasks.add(node_id)
+                elif dep_id not in task_map:
+                    # Dangling reference: no node to traverse
+                    continue
+                elif dep_id not in index:
+                    index[dep_id] = lowlink[dep_id] = counter
+                    counter += 1
+                    scc_stack.append(dep_id)
+                    on_stack.add(dep_id)
+                    work.append(
+                        (dep_id, iter(task_map[dep_id].get('dependencies', [])))
+                    )
+                elif dep_id in on_stack:
+                    # Back or cross edge within the current component
+                    lowlink[node_id] = min(lowlink[node_id], index[dep_id])
+
         return circular_tasks
     
     def build_dependency_map(self, tasks: List[Dict]) -> Dict[int, List[int]]:
@@ -212,31 +412,116 @@ class TaskScoringEngine:
         Returns:
             Dictionary mapping task_id to list of dependent task IDs
         """
-        dep_map = {}
-        
-        for task in tasks:
-            task_id = task.get('id')
-            dependencies = task.get('dependencies', [])
-            
-            for dep_id in dependencies:
-                if dep_id not in dep_map:
-                    dep_map[dep_id] = []
-                dep_map[dep_id].append(task_id)
-        
-        return dep_map
+        # Flatten the edges in a single comprehension (compiled to
+        # LIST_APPEND bytecode), then aggregate
+        pairs = [
+            (dep_id, task.get('id'))
+            for task in tasks
+            for dep_id in task.get('dependencies', ())
+        ]
+
+        dep_map = defaultdict(list)
+        for dep_id, task_id in pairs:
+            dep_map[dep_id].append(task_id)
+
+        # Plain dict for callers relying on KeyError/.get semantics
+        return dict(dep_map)
     
-    def calculate_priority_score(self, task: Dict, all_tasks: List[Dict], 
-                                dependency_map: Dict[int, List[int]]) -> Dict:
+    @classmethod
+    def _vectorized_scores(cls, tasks: List[Dict], blocked_counts: Dict[int, int],
+                           weight_vector: np.ndarray,
+                           today: Optional[date] = None):
+        """
+        Compute all four component scores for a batch of tasks with NumPy.
+
+        Mirrors the scalar calculate_*_score methods but evaluates the
+        piecewise buckets as array operations, so analyzing N tasks costs
+        a handful of vectorized passes instead of N Python calls.
+
+        Args:
+            tasks: List of task dictionaries
+            blocked_counts: Map of task_id -> number of dependent tasks
+            weight_vector: (4,) array of urgency/importance/effort/
+                dependency weights, e.g. an engine's _w_vec
+            today: Reference date, defaults to date.today()
+
+        Returns:
+            Tuple of (total, urgency, importance, effort, dependency) arrays
+        """
+        if today is None:
+            today = date.today()
+        n = len(tasks)
+
+        # Prefer the day offset precomputed during validation/analysis
+        days = np.fromiter(
+            (
+                t['_days_diff'] if '_days_diff' in t
+                else (t['due_date'] - today).days
+                for t in tasks
+            ),
+            dtype=np.int32, count=n
+        )
+        hours = np.array([t.get('estimated_hours', 1) for t in tasks], dtype=np.float64)
+        importance = np.clip(
+            np.array([t.get('importance', 5) for t in tasks], dtype=np.float64),
+            1, 10
+        )
+        blocked = np.fromiter(
+            (blocked_counts.get(t.get('id'), 0) for t in tasks),
+            dtype=np.int32, count=n
+        )
+
+        if _HAVE_NUMBA:
+            out = _score_kernel(days, hours, importance, blocked, weight_vector)
+            return out[:, 0], out[:, 1], out[:, 2], out[:, 3], out[:, 4]
+
+        # Same buckets as calculate_urgency_score: branchless table lookup
+        # via searchsorted, then mask in the overdue head and log tail
+        urg_idx = np.searchsorted(_URG_THRESH_NP, days, side='left')
+        urgency = _URG_INTERCEPT_NP.take(urg_idx) + _URG_SLOPE_NP.take(urg_idx) * days
+        urgency = np.where(
+            days < 0,
+            np.minimum(10.0 + np.minimum(np.abs(days) * 0.5, 5.0), 15.0),
+            urgency
+        )
+        urgency = np.where(
+            days > _URG_THRESH[-1],
+            np.maximum(1.0, 3.0 - np.log10(np.maximum(days - 29, 1))),
+            urgency
+        )
+
+        # Same buckets as calculate_effort_score
+        eff_idx = np.searchsorted(_EFF_THRESH_NP, hours, side='left')
+        effort = _EFF_INTERCEPT_NP.take(eff_idx) + _EFF_SLOPE_NP.take(eff_idx) * hours
+        effort = np.where(
+            hours > _EFF_THRESH[-1],
+            np.maximum(1.0, 5.0 - np.log10(np.maximum(hours - 7, 1.0))),
+            effort
+        )
+        effort = np.where(hours < 1, 10.0, effort)
+        effort = np.where(hours <= 0, 5.0, effort)
+
+        # Same mapping as calculate_dependency_score
+        dependency = _DEP_SCORES_NP.take(np.minimum(blocked, 3))
+
+        # Weighted total in a single dot product over the (N, 4) matrix
+        components = np.stack([urgency, importance, effort, dependency], axis=1)
+        totals = components @ weight_vector
+
+        return totals, urgency, importance, effort, dependency
+
+    def calculate_priority_score(self, task: Dict, all_tasks: List[Dict],
+                                dependency_map: Dict[int, List[int]]) -> ScoreBreakdown:
         """
         Calculate comprehensive priority score for a task.
-        
+
         Args:
             task: Task dictionary with all required fields
             all_tasks: List of all tasks for dependency analysis
             dependency_map: Reverse dependency mapping
-            
+
         Returns:
-            Dictionary with score and component breakdown
+            ScoreBreakdown with the total and component scores
         """
         # Extract task data with validation
         due_date = task.get('due_date')
@@ -249,27 +534,25 @@ class TaskScoringEngine:
         importance_score = self.calculate_importance_score(importance)
         effort_score = self.calculate_effort_score(estimated_hours)
         dependency_score = self.calculate_dependency_score(
-            task_id, all_tasks, dependency_map
+            task_id, dependency_map
         )
         
-        # Calculate weighted total score
-        total_score = (
-            urgency_score * self.weights['urgency'] +
-            importance_score * self.weights['importance'] +
-            effort_score * self.weights['effort'] +
-            dependency_score * self.weights['dependencies']
+        # Calculate weighted total via the strategy-specialized function
+        total_score = self._score_fn(
+            urgency_score, importance_score, effort_score, dependency_score
         )
         
-        return {
-            'total_score': round(total_score, 2),
-            'urgency_score': round(urgency_score, 2),
-            'importance_score': round(importance_score, 2),
-            'effort_score': round(effort_score, 2),
-            'dependency_score': round(dependency_score, 2),
-            'weights_used': self.weights.copy()
-        }
+        return ScoreBreakdown(
+            total_score=total_score,
+            urgency_score=urgency_score,
+            importance_score=importance_score,
+            effort_score=effort_score,
+            dependency_score=dependency_score,
+            weights_used=self._weights_view
+        )
     
-    def generate_score_explanation(self, task: Dict, score_breakdown: Dict) -> str:
+    def generate_score_explanation(self, task: Dict, score_breakdown: ScoreBreakdown,
+                                   today: Optional[date] = None) -> str:
         """
         Generate human-readable explanation for why task received its score.
         
@@ -283,7 +566,11 @@ class TaskScoringEngine:
         explanations = []
         
         # Urgency explanation
-        days_diff = (task['due_date'] - date.today()).days
+        days_diff = task.get('_days_diff')
+        if days_diff is None:
+            if today is None:
+                today = date.today()
+            days_diff = (task['due_date'] - today).days
         if days_diff < 0:
             explanations.append(f"OVERDUE by {abs(days_diff)} days")
         elif days_diff == 0:
@@ -297,7 +584,7 @@ class TaskScoringEngine:
         if task['importance'] >= 8:
             explanations.append(f"High importance ({task['importance']}/10)")
         elif task['importance'] >= 6:
-            explanations.append(f"📌 Medium importance ({task['importance']}/10)")
+            explanations.append(f"Medium importance ({task['importance']}/10)")
         
         # Effort explanation
         if task['estimated_hours'] <= 2:
@@ -306,7 +593,7 @@ class TaskScoringEngine:
             explanations.append(f"Large task ({task['estimated_hours']}h)")
         
         # Dependency explanation
-        dep_score = score_breakdown['dependency_score']
+        dep_score = score_breakdown.dependency_score
         if dep_score >= 8:
             explanations.append("Blocks multiple tasks")
         elif dep_score >= 6:
@@ -314,49 +601,145 @@ class TaskScoringEngine:
         
         return " | ".join(explanations) if explanations else "Standard priority task"
     
-    def analyze_tasks(self, tasks: List[Dict]) -> List[Dict]:
+    def analyze_tasks(self, tasks: List[Dict], sort: bool = True) -> List[Dict]:
         """
         Analyze and score all tasks, returning them sorted by priority.
-        
+
         Args:
             tasks: List of task dictionaries
-            
+            sort: When True (default), return tasks sorted by priority
+                with explanations attached. When False, return them in
+                input order without explanations, letting callers select
+                a top-K subset and generate explanations only for it.
+
         Returns:
-            Sorted list of tasks with scores and explanations
+            List of tasks with scores (and explanations when sorted)
         """
         if not tasks:
             return []
-        
-        # Build dependency map
-        dependency_map = self.build_dependency_map(tasks)
-        
-        # Detect circular dependencies
-        circular_deps = self.detect_circular_dependencies(tasks)
-        
-        # Score each task
-        scored_tasks = []
+
+        # Resolve the reference date once for the whole analysis
+        today = date.today()
+
+        # Reuse a cached result when the same task set was analyzed
+        # today with the same strategy
+        cache_key = self._analysis_cache_key(tasks, today) if sort else None
+        if cache_key is not None:
+            cached = _ANALYSIS_CACHE.get(cache_key)
+            if cached is not None:
+                _ANALYSIS_CACHE.move_to_end(cache_key)
+                # Shallow-copy each task so callers can't mutate the cache
+                return [dict(task) for task in cached]
+
+        # Precompute day offsets in a single pass so urgency scoring and
+        # explanations read a plain int instead of re-subtracting dates
+        # (validation may already have attached them)
         for task in tasks:
-            score_breakdown = self.calculate_priority_score(
-                task, tasks, dependency_map
+            if '_days_diff' not in task:
+                task['_days_diff'] = (task['due_date'] - today).days
+
+        # Build the id -> task mapping once and share it across passes
+        task_map = {task['id']: task for task in tasks}
+
+        # Detect circular dependencies, reusing the prebuilt task map
+        circular_deps = self.detect_circular_dependencies(tasks, task_map=task_map)
+
+        # Scoring only needs how many tasks each task blocks, so count
+        # dependents in one C-speed pass instead of materializing the
+        # full list-valued dependency map
+        blocked_counts = Counter(
+            dep_id
+            for task in tasks
+            for dep_id in task.get('dependencies', ())
+        )
+
+        # Score the whole batch in one vectorized pass
+        totals, urgencies, importances, efforts, dependencies = self._vectorized_scores(
+            tasks, blocked_counts, self._w_vec, today=today
+        )
+
+        # Sort on the lightweight score array first, then decorate each
+        # task in priority order; the dict | merge avoids the slower
+        # {**task, ...} spread per task
+        rounded_totals = np.round(totals, 2)
+        if sort:
+            order = sorted(
+                range(len(tasks)), key=rounded_totals.__getitem__, reverse=True
             )
-            
-            explanation = self.generate_score_explanation(task, score_breakdown)
-            
-            task_result = {
-                **task,
-                'priority_score': score_breakdown['total_score'],
+        else:
+            order = range(len(tasks))
+
+        scored_tasks = []
+        for idx in order:
+            task = tasks[idx]
+            score_breakdown = ScoreBreakdown(
+                total_score=float(totals[idx]),
+                urgency_score=float(urgencies[idx]),
+                importance_score=float(importances[idx]),
+                effort_score=float(efforts[idx]),
+                dependency_score=float(dependencies[idx]),
+                weights_used=self._weights_view
+            )
+
+            task_result = task | {
+                'priority_score': float(rounded_totals[idx]),
                 'score_breakdown': score_breakdown,
-                'explanation': explanation,
                 'has_circular_dependency': task['id'] in circular_deps
             }
-            
+
+            if sort:
+                task_result['explanation'] = self.generate_score_explanation(
+                    task, score_breakdown, today=today
+                )
+
             scored_tasks.append(task_result)
-        
-        # Sort by priority score (descending)
-        scored_tasks.sort(key=lambda x: x['priority_score'], reverse=True)
-        
+
+        if cache_key is not None:
+            # Store copies, mirroring the shallow copy made on hits, so
+            # callers mutating the first-call result (as
+            # get_top_suggestions does) can't corrupt cached entries
+            _ANALYSIS_CACHE[cache_key] = [dict(task) for task in scored_tasks]
+            if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_MAXSIZE:
+                _ANALYSIS_CACHE.popitem(last=False)
+
         return scored_tasks
-    
+
+    def analyze_iter(self, tasks: List[Dict]) -> Iterator[Dict]:
+        """
+        Yield analyzed tasks in priority order, one at a time.
+
+        Scoring is inherently a batch operation (dependency counts and
+        the priority sort need the whole set), but yielding lets callers
+        serialize and stream each element without ever holding a second,
+        fully rendered copy of the output.
+        """
+        yield from self.analyze_tasks(tasks)
+
+    def _analysis_cache_key(self, tasks: List[Dict], today: date):
+        """
+        Build a hashable fingerprint of the task set for the analysis
+        cache, or None when the tasks are not cacheable (missing ids
+        or unhashable fields).
+        """
+        try:
+            return (
+                self.strategy,
+                today.toordinal(),
+                tuple(sorted(
+                    (
+                        task['id'],
+                        task['title'],
+                        task['due_date'].toordinal(),
+                        task['importance'],
+                        task['estimated_hours'],
+                        tuple(task.get('dependencies', ()))
+                    )
+                    for task in tasks
+                ))
+            )
+        except (KeyError, TypeError, AttributeError):
+            return None
+
     def get_top_suggestions(self, tasks: List[Dict], count: int = 3) -> List[Dict]:
         """
         Get top N task suggestions with detailed reasoning.
@@ -368,14 +751,22 @@ class TaskScoringEngine:
         Returns:
             List of top priority tasks with extended explanations
         """
-        scored_tasks = self.analyze_tasks(tasks)
-        top_tasks = scored_tasks[:count]
-        
+        # Score without the full sort: nlargest is O(N log K) and the
+        # explanations are only built for the selected top-K
+        scored_tasks = self.analyze_tasks(tasks, sort=False)
+        top_tasks = heapq.nlargest(
+            count, scored_tasks, key=itemgetter('priority_score')
+        )
+
         # Add ranking and enhanced explanations
+        today = date.today()
         for idx, task in enumerate(top_tasks, 1):
+            task['explanation'] = self.generate_score_explanation(
+                task, task['score_breakdown'], today=today
+            )
             task['rank'] = idx
             task['recommendation'] = self._generate_recommendation(task, idx)
-        
+
         return top_tasks
     
     def _generate_recommendation(self, task: Dict, rank: int) -> str:
@@ -383,14 +774,14 @@ class TaskScoringEngine:
         reasons = []
         
         breakdown = task['score_breakdown']
-        
-        if breakdown['urgency_score'] >= 9:
+
+        if breakdown.urgency_score >= 9:
             reasons.append("urgent deadline")
-        if breakdown['importance_score'] >= 8:
+        if breakdown.importance_score >= 8:
             reasons.append("high impact")
-        if breakdown['effort_score'] >= 8:
+        if breakdown.effort_score >= 8:
             reasons.append("quick completion")
-        if breakdown['dependency_score'] >= 7:
+        if breakdown.dependency_score >= 7:
             reasons.append("unblocks other work")
         
         if reasons:
@@ -3,6 +3,7 @@ Serializers for Task API endpoints.
 """
 from rest_framework import serializers
 from .models import Task
+from dataclasses import is_dataclass
 from datetime import date
 
 
@@ -31,108 +32,101 @@ class TaskSerializer(serializers.ModelSerializer):
             )
         return value
     
-    def validate_dependencies(self, value):
-        """Validate dependencies is a list of integers."""
-        if not isinstance(value, list):
+
+
+def _validate_and_normalize_tasks(value):
+    """
+    Validate and normalize a list of task dicts for analysis.
+
+    Shared by the analyze and suggest views, which call it directly on
+    the raw payload, so it must also enforce the list-of-dicts shape
+    the old ListField(child=DictField()) wrapper used to guarantee.
+    """
+    if not isinstance(value, list):
+        raise serializers.ValidationError("Tasks must be a list")
+
+    required_fields = ['title', 'due_date', 'estimated_hours', 'importance']
+    today = date.today()
+
+    for idx, task in enumerate(value):
+        if not isinstance(task, dict):
             raise serializers.ValidationError(
-                "Dependencies must be a list"
+                f"Task at index {idx} must be an object"
             )
-        
-        for dep_id in value:
-            if not isinstance(dep_id, int):
+
+        # Check required fields
+        for field in required_fields:
+            if field not in task:
                 raise serializers.ValidationError(
-                    "Each dependency must be an integer task ID"
+                    f"Task at index {idx} missing required field: {field}"
                 )
-        
-        return value
 
+        # Validate field types and values
+        try:
+            # Convert due_date string to date object
+            if isinstance(task['due_date'], str):
+                task['due_date'] = date.fromisoformat(task['due_date'])
 
-class TaskAnalysisInputSerializer(serializers.Serializer):
-    """Serializer for task analysis input."""
-    
-    tasks = serializers.ListField(
-        child=serializers.DictField(),
-        allow_empty=False,
-        help_text="List of tasks to analyze"
-    )
-    
-    strategy = serializers.ChoiceField(
-        choices=['smart_balance', 'fastest_wins', 'high_impact', 'deadline_driven'],
-        default='smart_balance',
-        required=False,
-        help_text="Scoring strategy to use"
-    )
-    
-    def validate_tasks(self, value):
-        """Validate each task has required fields."""
-        required_fields = ['title', 'due_date', 'estimated_hours', 'importance']
-        
-        for idx, task in enumerate(value):
-            # Check required fields
-            for field in required_fields:
-                if field not in task:
-                    raise serializers.ValidationError(
-                        f"Task at index {idx} missing required field: {field}"
-                    )
-            
-            # Validate field types and values
-            try:
-                # Convert due_date string to date object
-                if isinstance(task['due_date'], str):
-                    task['due_date'] = date.fromisoformat(task['due_date'])
-                
-                # Validate importance range
-                importance = int(task['importance'])
-                if importance < 1 or importance > 10:
-                    raise serializers.ValidationError(
-                        f"Task at index {idx}: importance must be 1-10"
-                    )
-                task['importance'] = importance
-                
-                # Validate estimated hours
-                hours = float(task['estimated_hours'])
-                if hours <= 0:
-                    raise serializers.ValidationError(
-                        f"Task at index {idx}: estimated_hours must be positive"
-                    )
-                task['estimated_hours'] = hours
-                
-                # Ensure dependencies is a list
-                if 'dependencies' not in task:
-                    task['dependencies'] = []
-                elif not isinstance(task['dependencies'], list):
-                    raise serializers.ValidationError(
-                        f"Task at index {idx}: dependencies must be a list"
-                    )
-                
-                # Add ID if not present (for analysis purposes)
-                if 'id' not in task:
-                    task['id'] = idx + 1
-                
-            except (ValueError, TypeError) as e:
+            # Precompute the day offset so scoring reads a plain int
+            task['_days_diff'] = (task['due_date'] - today).days
+
+            # Validate importance range
+            importance = int(task['importance'])
+            if importance < 1 or importance > 10:
                 raise serializers.ValidationError(
-                    f"Task at index {idx}: invalid data type - {str(e)}"
+                    f"Task at index {idx}: importance must be 1-10"
                 )
-        
-        return value
+            task['importance'] = importance
 
+            # Validate estimated hours
+            hours = float(task['estimated_hours'])
+            if hours <= 0:
+                raise serializers.ValidationError(
+                    f"Task at index {idx}: estimated_hours must be positive"
+                )
+            task['estimated_hours'] = hours
+
+            # Ensure dependencies is a list
+            if 'dependencies' not in task:
+                task['dependencies'] = []
+            elif not isinstance(task['dependencies'], list):
+                raise serializers.ValidationError(
+                    f"Task at index {idx}: dependencies must be a list"
+                )
+
+            # Add ID if not present (for analysis purposes)
+            if 'id' not in task:
+                task['id'] = idx + 1
+
+        except (ValueError, TypeError) as e:
+            raise serializers.ValidationError(
+                f"Task at index {idx}: invalid data type - {str(e)}"
+            )
+
+    return value
+
+
+class AnalysisOptionsSerializer(serializers.Serializer):
+    """
+    Validates just the option fields for analysis requests.
+
+    The task list deliberately isn't a serializer field: views hand it
+    straight to _validate_and_normalize_tasks so each task dict is
+    walked once instead of once by a ListField/DictField wrapper and
+    again by the normalizer.
+    """
 
-class TaskSuggestionInputSerializer(serializers.Serializer):
-    """Serializer for task suggestion input."""
-    
-    tasks = serializers.ListField(
-        child=serializers.DictField(),
-        allow_empty=False,
-        help_text="List of tasks to get suggestions from"
-    )
-    
     strategy = serializers.ChoiceField(
         choices=['smart_balance', 'fastest_wins', 'high_impact', 'deadline_driven'],
         default='smart_balance',
         required=False,
         help_text="Scoring strategy to use"
     )
-    
+
+
+class SuggestionOptionsSerializer(AnalysisOptionsSerializer):
+    """Option fields for suggestion requests."""
+
     count = serializers.IntegerField(
         default=3,
         min_value=1,
@@ -140,12 +134,6 @@ class TaskSuggestionInputSerializer(serializers.Serializer):
         required=False,
         help_text="Number of suggestions to return"
     )
-    
-    def validate_tasks(self, value):
-        """Reuse validation from TaskAnalysisInputSerializer."""
-        serializer = TaskAnalysisInputSerializer(data={'tasks': value})
-        serializer.is_valid(raise_exception=True)
-        return serializer.validated_data['tasks']
 
 
 class TaskAnalysisOutputSerializer(serializers.Serializer):
@@ -160,7 +148,24 @@ class TaskAnalysisOutputSerializer(serializers.Serializer):
     priority_score = serializers.FloatField()
     explanation = serializers.CharField()
     has_circular_dependency = serializers.BooleanField()
-    score_breakdown = serializers.DictField()
+    score_breakdown = serializers.SerializerMethodField()
+
+    def get_score_breakdown(self, obj):
+        """Render a ScoreBreakdown (or legacy dict), rounding at the edge."""
+        breakdown = obj['score_breakdown']
+        if is_dataclass(breakdown):
+            return {
+                'total_score': round(breakdown.total_score, 2),
+                'urgency_score': round(breakdown.urgency_score, 2),
+                'importance_score': round(breakdown.importance_score, 2),
+                'effort_score': round(breakdown.effort_score, 2),
+                'dependency_score': round(breakdown.dependency_score, 2),
+                'weights_used': dict(breakdown.weights_used),
+            }
+        return {
+            key: round(value, 2) if isinstance(value, float) else value
+            for key, value in dict(breakdown).items()
+        }
 
 
 class TaskSuggestionOutputSerializer(TaskAnalysisOutputSerializer):
@@ -0,0 +1,25 @@
+"""
+Celery tasks for offloading CPU-bound scoring work.
+"""
+from celery import shared_task
+
+from .scoring import TaskScoringEngine
+from .serializers import TaskAnalysisOutputSerializer
+
+
+@shared_task
+def analyze_tasks_async(strategy='smart_balance'):
+    """
+    Score all database tasks with the given strategy in a worker.
+
+    Returns the serialized analysis (a JSON-safe list of scored tasks)
+    so clients can poll the job endpoint for the result.
+    """
+    from .models import Task
+
+    tasks = Task.fetch_for_scoring()
+
+    scoring_engine = TaskScoringEngine(strategy=strategy)
+    analyzed_tasks = scoring_engine.analyze_tasks(tasks)
+
+    return TaskAnalysisOutputSerializer(analyzed_tasks, many=True).data
@@ -3,7 +3,7 @@ Unit tests for Smart Task Analyzer scoring algorithm.
 """
 from django.test import TestCase
 from datetime import date, timedelta
-from .scoring import TaskScoringEngine
+from .scoring import TaskScoringEngine, _ANALYSIS_CACHE
 
 
 class TaskScoringEngineTests(TestCase):
@@ -77,11 +77,11 @@ class TaskScoringEngineTests(TestCase):
         dep_map = self.engine.build_dependency_map(tasks)
         
         # Task 1 blocks 3 others, should have high score
-        score_task_1 = self.engine.calculate_dependency_score(1, tasks, dep_map)
+        score_task_1 = self.engine.calculate_dependency_score(1, dep_map)
         self.assertGreaterEqual(score_task_1, 8.0)
         
         # Task 4 blocks nothing, should have lower score
-        score_task_4 = self.engine.calculate_dependency_score(4, tasks, dep_map)
+        score_task_4 = self.engine.calculate_dependency_score(4, dep_map)
         self.assertEqual(score_task_4, 3.0)
     
     def test_circular_dependency_detection(self):
@@ -109,9 +109,34 @@ class TaskScoringEngineTests(TestCase):
             {'id': 2, 'dependencies': [1]},
             {'id': 3, 'dependencies': [2]},
         ]
-        
+
         circular_tasks = self.engine.detect_circular_dependencies(tasks)
         self.assertEqual(len(circular_tasks), 0)
+
+    def test_cycle_member_reached_through_shared_node(self):
+        """Tasks whose back edge targets an already-explored node are still flagged."""
+        # Two cycles share node 4: 1 -> 8 -> 4 -> 1 and 1 -> 7 -> 4 -> 1.
+        # Whichever branch is walked second reaches 4 after it has been
+        # fully explored, so membership must not depend on visit order.
+        tasks = [
+            {'id': 1, 'dependencies': [8, 7]},
+            {'id': 8, 'dependencies': [4]},
+            {'id': 4, 'dependencies': [1]},
+            {'id': 7, 'dependencies': [4]},
+        ]
+
+        circular_tasks = self.engine.detect_circular_dependencies(tasks)
+        self.assertEqual(circular_tasks, {1, 4, 7, 8})
+
+    def test_self_dependency_is_circular(self):
+        """A task depending on itself forms a one-node cycle."""
+        tasks = [
+            {'id': 1, 'dependencies': [1]},
+            {'id': 2, 'dependencies': [1]},
+        ]
+
+        circular_tasks = self.engine.detect_circular_dependencies(tasks)
+        self.assertEqual(circular_tasks, {1})
     
     def test_analyze_tasks_sorting(self):
         """Test that analyze_tasks correctly sorts by priority."""
@@ -253,4 +278,67 @@ class TaskScoringEngineTests(TestCase):
         
         # Task 2 should be blocking 1 task
         self.assertEqual(len(dep_map[2]), 1)
-        self.assertIn(3, dep_map[2])
\ No newline at end of file
+        self.assertIn(3, dep_map[2])
+
+
+class AnalysisCacheTests(TestCase):
+    """Test suite for the module-level analysis result cache."""
+
+    def setUp(self):
+        """Start each test with an empty cache and a fresh engine."""
+        _ANALYSIS_CACHE.clear()
+        self.engine = TaskScoringEngine(strategy='smart_balance')
+
+    def _tasks(self):
+        """Build a small, cacheable task set."""
+        return [
+            {
+                'id': 1,
+                'title': 'Write report',
+                'due_date': date.today() + timedelta(days=3),
+                'estimated_hours': 2.0,
+                'importance': 7,
+                'dependencies': []
+            },
+            {
+                'id': 2,
+                'title': 'Review report',
+                'due_date': date.today() + timedelta(days=5),
+                'estimated_hours': 1.0,
+                'importance': 5,
+                'dependencies': [1]
+            },
+        ]
+
+    def test_repeat_analysis_hits_cache(self):
+        """Analyzing the same task set twice reuses the cached entry."""
+        first = self.engine.analyze_tasks(self._tasks())
+        self.assertEqual(len(_ANALYSIS_CACHE), 1)
+
+        second = self.engine.analyze_tasks(self._tasks())
+        self.assertEqual(len(_ANALYSIS_CACHE), 1)
+        self.assertEqual(
+            [(t['id'], t['priority_score']) for t in first],
+            [(t['id'], t['priority_score']) for t in second]
+        )
+
+    def test_changed_tasks_miss_cache(self):
+        """Changing any task field produces a fresh cache entry."""
+        self.engine.analyze_tasks(self._tasks())
+
+        changed = self._tasks()
+        changed[0]['importance'] = 2
+        self.engine.analyze_tasks(changed)
+
+        self.assertEqual(len(_ANALYSIS_CACHE), 2)
+
+    def test_caller_mutation_does_not_corrupt_cache(self):
+        """Mutating a returned result must not leak into cached entries."""
+        first = self.engine.analyze_tasks(self._tasks())
+        first[0]['rank'] = 99
+        first[0]['priority_score'] = -1.0
+
+        second = self.engine.analyze_tasks(self._tasks())
+
+        self.assertNotIn('rank', second[0])
+        self.assertGreaterEqual(second[0]['priority_score'], 0.0)
\ No newline at end of file
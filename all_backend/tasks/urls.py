@@ -13,6 +13,7 @@ urlpatterns = [
     
     # Analysis endpoints
     path('tasks/analyze/', views.analyze_tasks, name='analyze_tasks'),
+    path('tasks/analyze/<str:job_id>/', views.analyze_job_status, name='analyze_job_status'),
     path('tasks/suggest/', views.suggest_tasks, name='suggest_tasks'),
     
     # Health check
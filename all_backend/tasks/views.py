@@ -1,23 +1,95 @@
 """
 API views for Smart Task Analyzer.
 """
+from celery.result import AsyncResult
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, prefetch_related_objects
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.utils.encoders import JSONEncoder
 from .models import Task
 from .serializers import (
     TaskSerializer,
-    TaskAnalysisInputSerializer,
-    TaskSuggestionInputSerializer,
+    AnalysisOptionsSerializer,
+    SuggestionOptionsSerializer,
     TaskAnalysisOutputSerializer,
-    TaskSuggestionOutputSerializer
+    TaskSuggestionOutputSerializer,
+    _validate_and_normalize_tasks
 )
 from .scoring import TaskScoringEngine
+from .tasks import analyze_tasks_async
+from datetime import date
+from functools import lru_cache
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on tasks accepted per bulk request; larger ingests must
+# be split into multiple calls so a single upload can't exhaust worker
+# memory during validation
+MAX_BULK_TASKS = 1000
 
+# Database analyses larger than this are offloaded to a Celery worker
+# so scoring doesn't tie up an HTTP worker; clients poll the job
+# endpoint for the result
+ANALYZE_ASYNC_THRESHOLD = 200
+
+
+@lru_cache(maxsize=8)
+def _engine(strategy):
+    """
+    One TaskScoringEngine per strategy, shared across requests.
+
+    Construction builds the weight vector and generates the specialized
+    scoring function; engines hold no per-call state (the reference date
+    is threaded through as a parameter), so reuse is safe.
+    """
+    return TaskScoringEngine(strategy=strategy)
+
+
+def _stream_analysis(analyzed_iter, strategy, source):
+    """
+    Generate a JSON analyze response one task at a time so the full
+    rendered payload never sits in memory and the client sees first
+    bytes as soon as scoring finishes.
+    """
+    yield f'{{"status":"success","strategy":"{strategy}","source":"{source}","tasks":['
+    first = True
+    for task in analyzed_iter:
+        chunk = json.dumps(TaskAnalysisOutputSerializer(task).data, cls=JSONEncoder)
+        yield chunk if first else ',' + chunk
+        first = False
+    yield ']}'
+
+
+def _task_list_etag():
+    """
+    Cheap fingerprint of the task table: row count plus the newest
+    updated_at. One aggregate query instead of fetching and rendering
+    the whole list when nothing has changed.
+    """
+    agg = Task.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+    latest = agg['latest'].timestamp() if agg['latest'] else 0
+    return f'"{agg["count"]}-{latest}"'
+
+
+def _server_error(message, exc):
+    """
+    Build a 500 response body. The exception text is only exposed when
+    DEBUG is on — in production it just bloats the payload and leaks
+    stack-derived strings (the full traceback is already in the log).
+    """
+    payload = {'status': 'error', 'message': message}
+    if settings.DEBUG:
+        payload['detail'] = str(exc)
+    return Response(payload, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(['GET', 'POST'])
@@ -28,20 +100,26 @@ def task_list(request):
     """
     if request.method == 'GET':
         try:
-            tasks = Task.objects.all()
+            # Answer unchanged polls with 304 before touching the rows;
+            # handled here rather than with @condition so the ETag
+            # aggregate doesn't run for POSTs
+            etag = _task_list_etag()
+            if request.headers.get('If-None-Match') == etag:
+                return Response(status=status.HTTP_304_NOT_MODIFIED,
+                                headers={'ETag': etag})
+
+            # Force a single SELECT; len() on the fetched list avoids
+            # the extra COUNT(*) round-trip
+            tasks = list(Task.objects.prefetch_related('dependencies'))
             serializer = TaskSerializer(tasks, many=True)
             return Response({
                 'status': 'success',
-                'count': tasks.count(),
+                'count': len(tasks),
                 'tasks': serializer.data
-            }, status=status.HTTP_200_OK)
+            }, status=status.HTTP_200_OK, headers={'ETag': etag})
         except Exception as e:
-            logger.error(f"Error in task_list GET: {str(e)}", exc_info=True)
-            return Response({
-                'status': 'error',
-                'message': 'Failed to retrieve tasks',
-                'detail': str(e)
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            logger.error("Error in task_list GET: %s", e, exc_info=True)
+            return _server_error('Failed to retrieve tasks', e)
     
     elif request.method == 'POST':
         try:
@@ -54,21 +132,19 @@ def task_list(request):
                     'errors': serializer.errors
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            task = serializer.save()
-            
+            serializer.save()
+
+            # serializer.data already reflects the saved instance — no
+            # need to build and walk a second serializer
             return Response({
                 'status': 'success',
                 'message': 'Task created successfully',
-                'task': TaskSerializer(task).data
+                'task': serializer.data
             }, status=status.HTTP_201_CREATED)
             
         except Exception as e:
-            logger.error(f"Error in task_list POST: {str(e)}", exc_info=True)
-            return Response({
-                'status': 'error',
-                'message': 'Failed to create task',
-                'detail': str(e)
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            logger.error("Error in task_list POST: %s", e, exc_info=True)
+            return _server_error('Failed to create task', e)
 
 
 @api_view(['GET', 'PUT', 'DELETE'])
@@ -78,14 +154,8 @@ def task_detail(request, task_id):
     PUT /api/tasks/<id>/ - Update a specific task
     DELETE /api/tasks/<id>/ - Delete a specific task
     """
-    try:
-        task = Task.objects.get(id=task_id)
-    except Task.DoesNotExist:
-        return Response({
-            'status': 'error',
-            'message': f'Task with id {task_id} not found'
-        }, status=status.HTTP_404_NOT_FOUND)
-    
+    task = get_object_or_404(Task, id=task_id)
+
     if request.method == 'GET':
         serializer = TaskSerializer(task)
         return Response({
@@ -103,12 +173,12 @@ def task_detail(request, task_id):
                 'errors': serializer.errors
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        updated_task = serializer.save()
-        
+        serializer.save()
+
         return Response({
             'status': 'success',
             'message': 'Task updated successfully',
-            'task': TaskSerializer(updated_task).data
+            'task': serializer.data
         }, status=status.HTTP_200_OK)
     
     elif request.method == 'DELETE':
@@ -146,23 +216,88 @@ def bulk_create_tasks(request):
                 'status': 'error',
                 'message': 'No tasks provided'
             }, status=status.HTTP_400_BAD_REQUEST)
-        
-        created_tasks = []
+
+        if len(tasks_data) > MAX_BULK_TASKS:
+            return Response({
+                'status': 'error',
+                'message': f'Max {MAX_BULK_TASKS} tasks per request'
+            }, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        candidates = []
         errors = []
-        
+
         for idx, task_data in enumerate(tasks_data):
-            serializer = TaskSerializer(data=task_data)
-            
+            # Dependencies are validated in one batched query below, so
+            # keep them out of the serializer, which would otherwise
+            # resolve each ID with its own SELECT
+            deps = task_data.get('dependencies', [])
+            if not isinstance(deps, list) or not all(
+                isinstance(dep, int) for dep in deps
+            ):
+                errors.append({
+                    'index': idx,
+                    'data': task_data,
+                    'errors': {'dependencies': [
+                        'Dependencies must be a list of integer task IDs'
+                    ]}
+                })
+                continue
+
+            serializer = TaskSerializer(data={
+                key: value for key, value in task_data.items()
+                if key != 'dependencies'
+            })
+
             if serializer.is_valid():
-                task = serializer.save()
-                created_tasks.append(TaskSerializer(task).data)
+                candidates.append((idx, task_data, serializer.validated_data, deps))
             else:
                 errors.append({
                     'index': idx,
                     'data': task_data,
                     'errors': serializer.errors
                 })
-        
+
+        # Check every referenced dependency ID across the batch with a
+        # single id__in query instead of one EXISTS per dependency
+        all_deps = {dep for _, _, _, deps in candidates for dep in deps}
+        existing_ids = set(Task.objects.filter(
+            id__in=all_deps
+        ).values_list('id', flat=True)) if all_deps else set()
+
+        valid_items = []
+        for idx, task_data, item, deps in candidates:
+            unknown = [dep for dep in deps if dep not in existing_ids]
+            if unknown:
+                errors.append({
+                    'index': idx,
+                    'data': task_data,
+                    'errors': {'dependencies': [
+                        f'Unknown task IDs: {sorted(unknown)}'
+                    ]}
+                })
+            else:
+                valid_items.append((item, deps))
+
+        errors.sort(key=lambda err: err['index'])
+
+        # One batched INSERT per 500 rows in a single transaction
+        # instead of an INSERT round-trip per task; dependency links go
+        # in as batched through-table rows the same way
+        objs = [Task(**item) for item, _ in valid_items]
+        through = Task.dependencies.through
+        with transaction.atomic():
+            created = Task.objects.bulk_create(objs, batch_size=500)
+            dep_rows = [
+                through(from_task_id=task.id, to_task_id=dep)
+                for task, (_, deps) in zip(created, valid_items)
+                for dep in deps
+            ]
+            if dep_rows:
+                through.objects.bulk_create(dep_rows, batch_size=500)
+
+        prefetch_related_objects(created, 'dependencies')
+        created_tasks = TaskSerializer(created, many=True).data
+
         response_data = {
             'status': 'success' if not errors else 'partial',
             'created_count': len(created_tasks),
@@ -176,12 +311,8 @@ def bulk_create_tasks(request):
         return Response(response_data, status=status.HTTP_201_CREATED)
         
     except Exception as e:
-        logger.error(f"Error in bulk_create_tasks: {str(e)}", exc_info=True)
-        return Response({
-            'status': 'error',
-            'message': 'Failed to create tasks',
-            'detail': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        logger.error("Error in bulk_create_tasks: %s", e, exc_info=True)
+        return _server_error('Failed to create tasks', e)
 
 
 @api_view(['DELETE'])
@@ -190,21 +321,24 @@ def delete_all_tasks(request):
     DELETE /api/tasks/all/ - Delete all tasks (useful for testing)
     """
     try:
-        count = Task.objects.count()
-        Task.objects.all().delete()
-        
+        # _raw_delete issues a single DELETE without materializing IDs
+        # or firing per-object signals; the dependency through table
+        # goes first so no FK rows are left dangling. SQLite has no
+        # TRUNCATE, and this is its closest constant-memory equivalent.
+        with transaction.atomic():
+            through_qs = Task.dependencies.through.objects.all()
+            through_qs._raw_delete(through_qs.db)
+            task_qs = Task.objects.all()
+            count = task_qs._raw_delete(task_qs.db)
+
         return Response({
             'status': 'success',
             'message': f'Deleted {count} tasks'
         }, status=status.HTTP_200_OK)
         
     except Exception as e:
-        logger.error(f"Error in delete_all_tasks: {str(e)}", exc_info=True)
-        return Response({
-            'status': 'error',
-            'message': 'Failed to delete tasks',
-            'detail': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        logger.error("Error in delete_all_tasks: %s", e, exc_info=True)
+        return _server_error('Failed to delete tasks', e)
 
 
 @api_view(['POST'])
@@ -230,72 +364,163 @@ def analyze_tasks(request):
     try:
         use_database = request.data.get('use_database', True)
         strategy = request.data.get('strategy', 'smart_balance')
-        
+        cache_key = None
+
+        # Reject unknown strategies up front: the raw string is
+        # interpolated into the streaming preamble and keys both the
+        # engine and response caches, so only known names may pass
+        if strategy not in TaskScoringEngine.STRATEGY_WEIGHTS:
+            return Response({
+                'status': 'error',
+                'message': 'Invalid input data',
+                'errors': {'strategy': [f'"{strategy}" is not a valid choice.']}
+            }, status=status.HTTP_400_BAD_REQUEST)
+
         # Check if tasks are provided in request
         if 'tasks' in request.data and request.data['tasks']:
-            # Use provided tasks (original behavior)
-            input_serializer = TaskAnalysisInputSerializer(data=request.data)
-            
-            if not input_serializer.is_valid():
+            # Validate options with the light serializer and normalize
+            # the task list in a single pass — no second walk through a
+            # nested ListField
+            options = AnalysisOptionsSerializer(data=request.data)
+
+            if not options.is_valid():
                 return Response({
                     'status': 'error',
                     'message': 'Invalid input data',
-                    'errors': input_serializer.errors
+                    'errors': options.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            strategy = options.validated_data['strategy']
+            try:
+                tasks = _validate_and_normalize_tasks(request.data['tasks'])
+            except ValidationError as exc:
+                return Response({
+                    'status': 'error',
+                    'message': 'Invalid input data',
+                    'errors': {'tasks': exc.detail}
                 }, status=status.HTTP_400_BAD_REQUEST)
-            
-            validated_data = input_serializer.validated_data
-            tasks = validated_data['tasks']
-            strategy = validated_data.get('strategy', 'smart_balance')
         else:
-            # Use database tasks
-            db_tasks = Task.objects.all()
-            
-            if not db_tasks.exists():
+            # One cheap aggregate answers emptiness, the async-offload
+            # threshold, and the cache version before any rows move
+            version = Task.objects.aggregate(
+                count=Count('id'), latest=Max('updated_at')
+            )
+
+            if not version['count']:
                 return Response({
                     'status': 'error',
                     'message': 'No tasks found in database. Please create tasks first.'
                 }, status=status.HTTP_404_NOT_FOUND)
-            
-            # Convert database tasks to dict format
-            tasks = []
-            for task in db_tasks:
-                tasks.append({
-                    'id': task.id,
-                    'title': task.title,
-                    'due_date': task.due_date,
-                    'estimated_hours': task.estimated_hours,
-                    'importance': task.importance,
-                    'dependencies': task.dependencies
-                })
-        
+
+            # Repeat analyses of unchanged data come straight from the
+            # cache; the key embeds the data version and scoring date,
+            # so writes and day rollovers invalidate it implicitly
+            latest = version['latest'].timestamp() if version['latest'] else 0
+            cache_key = (
+                f"analyze:{strategy}:{date.today().toordinal()}:"
+                f"{version['count']}:{latest}"
+            )
+            if not request.data.get('stream'):
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return Response(cached, status=status.HTTP_200_OK)
+
+            # Large database analyses are scored in a Celery worker so
+            # the HTTP worker isn't blocked; the client polls
+            # GET /api/tasks/analyze/<job_id>/ for the result
+            if version['count'] > ANALYZE_ASYNC_THRESHOLD:
+                job = analyze_tasks_async.delay(strategy=strategy)
+                return Response({
+                    'status': 'pending',
+                    'strategy': strategy,
+                    'job_id': job.id,
+                    'message': (
+                        f'Analysis of {version["count"]} tasks queued. '
+                        f'Poll /api/tasks/analyze/{job.id}/ for the result.'
+                    )
+                }, status=status.HTTP_202_ACCEPTED)
+
+            # Two fixed queries (scalar columns plus dependency links)
+            # merged into scoring-ready dicts with day offsets attached
+            tasks = Task.fetch_for_scoring()
+
         # Initialize scoring engine with strategy
-        scoring_engine = TaskScoringEngine(strategy=strategy)
-        
+        scoring_engine = _engine(strategy)
+
+        # Opt-in streaming: emit the JSON array element by element so
+        # peak memory stays flat and time-to-first-byte doesn't wait on
+        # rendering the whole payload
+        if request.data.get('stream'):
+            return StreamingHttpResponse(
+                _stream_analysis(
+                    scoring_engine.analyze_iter(tasks),
+                    strategy,
+                    'database' if use_database else 'request'
+                ),
+                content_type='application/json'
+            )
+
         # Analyze tasks
         analyzed_tasks = scoring_engine.analyze_tasks(tasks)
         
         # Serialize output
         output_serializer = TaskAnalysisOutputSerializer(
-            analyzed_tasks, 
+            analyzed_tasks,
             many=True
         )
-        
-        return Response({
+
+        payload = {
             'status': 'success',
             'strategy': strategy,
             'source': 'database' if use_database else 'request',
             'total_tasks': len(analyzed_tasks),
             'tasks': output_serializer.data
-        }, status=status.HTTP_200_OK)
-        
+        }
+
+        if cache_key is not None:
+            cache.set(cache_key, payload, 300)
+
+        return Response(payload, status=status.HTTP_200_OK)
+
     except Exception as e:
-        logger.error(f"Error in analyze_tasks: {str(e)}", exc_info=True)
+        logger.error("Error in analyze_tasks: %s", e, exc_info=True)
+        return _server_error('An error occurred while analyzing tasks', e)
+
+
+@api_view(['GET'])
+def analyze_job_status(request, job_id):
+    """
+    GET /api/tasks/analyze/<job_id>/
+
+    Check on an analysis job queued by POST /api/tasks/analyze/.
+    Returns the analyzed tasks once the worker has finished.
+    """
+    result = AsyncResult(job_id)
+
+    if result.failed():
         return Response({
             'status': 'error',
-            'message': 'An error occurred while analyzing tasks',
-            'detail': str(e)
+            'job_id': job_id,
+            'message': 'Analysis job failed',
+            'detail': str(result.result)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    if not result.ready():
+        return Response({
+            'status': 'pending',
+            'job_id': job_id,
+            'state': result.state
+        }, status=status.HTTP_200_OK)
+
+    analyzed_tasks = result.result
+    return Response({
+        'status': 'success',
+        'job_id': job_id,
+        'source': 'database',
+        'total_tasks': len(analyzed_tasks),
+        'tasks': analyzed_tasks
+    }, status=status.HTTP_200_OK)
+
 
 @api_view(['POST'])
 def suggest_tasks(request):
@@ -323,47 +548,53 @@ def suggest_tasks(request):
         use_database = request.data.get('use_database', True)
         strategy = request.data.get('strategy', 'smart_balance')
         count = request.data.get('count', 3)
-        
+
+        # Same up-front strategy check as analyze_tasks: the raw string
+        # keys the shared engine cache, so only known names may pass
+        if strategy not in TaskScoringEngine.STRATEGY_WEIGHTS:
+            return Response({
+                'status': 'error',
+                'message': 'Invalid input data',
+                'errors': {'strategy': [f'"{strategy}" is not a valid choice.']}
+            }, status=status.HTTP_400_BAD_REQUEST)
+
         # Check if tasks are provided in request
         if 'tasks' in request.data and request.data['tasks']:
-            # Use provided tasks
-            input_serializer = TaskSuggestionInputSerializer(data=request.data)
-            
-            if not input_serializer.is_valid():
+            # Validate options with the light serializer and normalize
+            # the task list in a single pass — no second walk through a
+            # nested ListField
+            options = SuggestionOptionsSerializer(data=request.data)
+
+            if not options.is_valid():
                 return Response({
                     'status': 'error',
                     'message': 'Invalid input data',
-                    'errors': input_serializer.errors
+                    'errors': options.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            strategy = options.validated_data['strategy']
+            count = options.validated_data['count']
+            try:
+                tasks = _validate_and_normalize_tasks(request.data['tasks'])
+            except ValidationError as exc:
+                return Response({
+                    'status': 'error',
+                    'message': 'Invalid input data',
+                    'errors': {'tasks': exc.detail}
                 }, status=status.HTTP_400_BAD_REQUEST)
-            
-            validated_data = input_serializer.validated_data
-            tasks = validated_data['tasks']
-            strategy = validated_data.get('strategy', 'smart_balance')
-            count = validated_data.get('count', 3)
         else:
-            # Use database tasks
-            db_tasks = Task.objects.all()
-            
-            if not db_tasks.exists():
+            # Two fixed queries (scalar columns plus dependency links)
+            # merged into scoring-ready dicts with day offsets attached
+            tasks = Task.fetch_for_scoring()
+
+            if not tasks:
                 return Response({
                     'status': 'error',
                     'message': 'No tasks found in database. Please create tasks first.'
                 }, status=status.HTTP_404_NOT_FOUND)
-            
-            # Convert database tasks to dict format
-            tasks = []
-            for task in db_tasks:
-                tasks.append({
-                    'id': task.id,
-                    'title': task.title,
-                    'due_date': task.due_date,
-                    'estimated_hours': task.estimated_hours,
-                    'importance': task.importance,
-                    'dependencies': task.dependencies
-                })
         
         # Initialize scoring engine with strategy
-        scoring_engine = TaskScoringEngine(strategy=strategy)
+        scoring_engine = _engine(strategy)
         
         # Get top suggestions
         suggestions = scoring_engine.get_top_suggestions(tasks, count=count)
@@ -383,12 +614,8 @@ def suggest_tasks(request):
         }, status=status.HTTP_200_OK)
         
     except Exception as e:
-        logger.error(f"Error in suggest_tasks: {str(e)}", exc_info=True)
-        return Response({
-            'status': 'error',
-            'message': 'An error occurred while generating suggestions',
-            'detail': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        logger.error("Error in suggest_tasks: %s", e, exc_info=True)
+        return _server_error('An error occurred while generating suggestions', e)
 
 
 @api_view(['GET'])
@@ -398,7 +625,12 @@ def health_check(request):
     
     Simple health check endpoint to verify API is running.
     """
-    task_count = Task.objects.count()
+    # Liveness probes hit this every few seconds; a short-TTL cache
+    # keeps them from issuing a COUNT(*) each time
+    task_count = cache.get('task_count')
+    if task_count is None:
+        task_count = Task.objects.count()
+        cache.set('task_count', task_count, 10)
     
     return Response({
         'status': 'healthy',